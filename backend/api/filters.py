@@ -1,5 +1,7 @@
 from django_filters import rest_framework as filters
-from recipes.models import Recipe, Ingredient
+from django.db.models import Exists, OuterRef
+from django.db.models.functions import Lower
+from recipes.models import Recipe, Ingredient, Tag, Favorite, ShoppingCart
 
 
 class RecipeFilter(filters.FilterSet):
@@ -15,23 +17,27 @@ class RecipeFilter(filters.FilterSet):
             для рецептов в списке покупок или не в нём.
 
     Атрибуты:
-        - `tags` `(AllValuesMultipleFilter)`: Фильтр по тегам рецептов.
+        - `tags` `(ModelMultipleChoiceFilter)`: Фильтр по slug тегов.
         - `is_favorited` `(BooleanFilter)`: Фильтр по наличию в избранном.
         - `is_in_shopping_cart` `(BooleanFilter)`:
             Фильтр по наличию в корзине покупок.
-        - `author` `(AllValuesMultipleFilter)`: Фильтр по автору рецепта.
+        - `author` `(NumberFilter)`: Фильтр по автору рецепта.
 
     Meta:
         - `model` `(Model)`: Модель, к которой применяются фильтры.
         - `fields` `(tuple)`: Поля модели, по которым можно фильтровать.
     """
 
-    tags = filters.AllValuesMultipleFilter(field_name='tags__slug')
+    tags = filters.ModelMultipleChoiceFilter(
+        field_name='tags__slug',
+        to_field_name='slug',
+        queryset=Tag.objects.all()
+    )
     is_favorited = filters.BooleanFilter(method='get_is_favorited')
     is_in_shopping_cart = filters.BooleanFilter(
         method='get_is_in_shopping_cart'
     )
-    author = filters.AllValuesMultipleFilter(field_name='author__id')
+    author = filters.NumberFilter(field_name='author_id')
 
     class Meta:
         model = Recipe
@@ -51,8 +57,14 @@ class RecipeFilter(filters.FilterSet):
         Возвращает:
             - `QuerySet`: Фильтрованный QuerySet рецептов.
         """
-        if value:
-            return queryset.filter(favoriting__user=self.request.user)
+        if value and self.request.user.is_authenticated:
+            return queryset.filter(
+                Exists(
+                    Favorite.objects.filter(
+                        user=self.request.user, recipe=OuterRef('pk')
+                    )
+                )
+            )
         return queryset
 
     def get_is_in_shopping_cart(self, queryset, name, value):
@@ -69,8 +81,14 @@ class RecipeFilter(filters.FilterSet):
         Возвращает:
             QuerySet: Фильтрованный QuerySet рецептов.
         """
-        if value:
-            return queryset.filter(shopping_cart__user=self.request.user)
+        if value and self.request.user.is_authenticated:
+            return queryset.filter(
+                Exists(
+                    ShoppingCart.objects.filter(
+                        user=self.request.user, recipe=OuterRef('pk')
+                    )
+                )
+            )
         return queryset
 
 
@@ -86,7 +104,28 @@ class IngredientSearchFilter(filters.FilterSet):
         - `model` `(Model)`: Модель, к которой применяется фильтр.
         - `fields` `(tuple)`: Поля модели, по которым можно фильтровать.
     """
-    name = filters.CharFilter(lookup_expr='istartswith')
+    name = filters.CharFilter(method='filter_name')
+
+    def filter_name(self, queryset, name, value):
+        """
+        Фильтрует ингредиенты по началу имени без учёта регистра.
+
+        Запрос приводится к нижнему регистру в Python, а сравнение
+        выполняется как префиксный `LIKE` по `LOWER(name)` — ровно
+        тому выражению, которое покрыто индексом
+        `ingredient_name_lower_idx` (см. `recipes.models`).
+
+        Аргументы:
+            - `queryset` `(QuerySet)`: Исходный QuerySet ингредиентов.
+            - `name` `(str)`: Имя поля фильтра.
+            - `value` `(str)`: Искомое начало названия.
+
+        Возвращает:
+            - `QuerySet`: Фильтрованный QuerySet ингредиентов.
+        """
+        return queryset.annotate(name_lower=Lower('name')).filter(
+            name_lower__startswith=value.lower()
+        )
 
     class Meta:
         model = Ingredient
@@ -0,0 +1,18 @@
+from rest_framework.pagination import PageNumberPagination
+
+
+class LimitPageNumberPagination(PageNumberPagination):
+    """
+    Пагинация списков с клиентским параметром `limit`.
+
+    Размер страницы берётся из настроек, может быть изменён параметром
+    `limit` и ограничен сверху, чтобы один запрос не мог
+    материализовать неограниченный список.
+
+    Атрибуты:
+        - `page_size_query_param` `(str)`: Параметр размера страницы.
+        - `max_page_size` `(int)`: Верхняя граница размера страницы.
+    """
+
+    page_size_query_param = 'limit'
+    max_page_size = 100
@@ -1,3 +1,6 @@
+import copy
+from functools import lru_cache
+
 from rest_framework import serializers
 from django.db import transaction
 from drf_extra_fields.fields import Base64ImageField
@@ -9,9 +12,44 @@ from djoser.serializers import UserSerializer, UserCreateSerializer
 
 
 RECIPES_LIMIT: int = 2
+INGREDIENT_BATCH_SIZE: int = 500
+IMAGE_URL_CACHE_SIZE: int = 1024
+
+
+@lru_cache(maxsize=IMAGE_URL_CACHE_SIZE)
+def recipe_image_url(name):
+    """
+    Возвращает URL картинки рецепта по имени файла.
+
+    Обращение к бэкенду хранилища кэшируется: для локального хранилища
+    это экономит конкатенации, для подписывающих URL бэкендов —
+    построение подписи на каждую строку списка.
+    """
+    return Recipe._meta.get_field('image').storage.url(name)
+
+
+class CachedFieldsMixin:
+    """
+    Примесь, кэширующая результат `get_fields` на уровне класса.
+
+    DRF для каждого экземпляра сериализатора заново строит карту полей:
+    deepcopy объявленных полей плюс интроспекция модели. Поля здесь не
+    хранят состояния между запросами, поэтому карта строится один раз
+    на класс, а экземплярам выдаются поверхностные копии полей.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        fields = CachedFieldsMixin._fields_cache.get(cls)
+        if fields is None:
+            fields = super().get_fields()
+            CachedFieldsMixin._fields_cache[cls] = fields
+        return {name: copy.copy(field) for name, field in fields.items()}
 
 
-class CustomUserSerializer(UserSerializer):
+class CustomUserSerializer(CachedFieldsMixin, UserSerializer):
     """
     Сериализатор пользователей.
 
@@ -44,12 +82,20 @@ class CustomUserSerializer(UserSerializer):
     is_subscribed = serializers.SerializerMethodField(read_only=True)
 
     def get_is_subscribed(self, object):
+        if hasattr(object, 'is_subscribed'):
+            return object.is_subscribed
         request = self.context.get('request')
-        return (
-            request is not None
-            and not request.user.is_anonymous
-            and object.author.filter(subscriber=request.user).exists()
-        )
+        if request is None or request.user.is_anonymous:
+            return False
+        subscribed_ids = getattr(request, '_subscribed_authors_cache', None)
+        if subscribed_ids is None:
+            subscribed_ids = frozenset(
+                AuthorSubscription.objects.filter(
+                    subscriber=request.user
+                ).values_list('author_id', flat=True)
+            )
+            request._subscribed_authors_cache = subscribed_ids
+        return object.id in subscribed_ids
 
     class Meta:
         model = CustomUser
@@ -170,29 +216,20 @@ class SubscriptionShowSerializer(CustomUserSerializer):
         Возвращает:
             - `list`: Список рецептов авторов.
 
-        - `get_recipes_count`:
-            Получить количество рецептов авторов,
-            на которых подписан пользователь.
-
-        Аргументы:
-            - `object` `(CustomUser)`: Объект пользователя.
-
-        Возвращает:
-            - `int`: Количество рецептов авторов.
+    Поле `recipes_count` читается из денормализованного счётчика на
+    модели пользователя (см. `recipes.signals`) вместо отдельного
+    запроса `count()` на каждого автора.
     """
 
     recipes = serializers.SerializerMethodField()
-    recipes_count = serializers.SerializerMethodField()
+    recipes_count = serializers.IntegerField(read_only=True)
 
     def get_recipes(self, object):
         author_recipes = object.recipes.all()[:RECIPES_LIMIT]
-        return RecipeSerializer(
-            author_recipes, many=True
+        return RecipeBriefSerializer(
+            author_recipes, many=True, context=self.context
         ).data
 
-    def get_recipes_count(self, object):
-        return object.recipes.count()
-
     class Meta:
         model = CustomUser
         fields = (
@@ -207,7 +244,7 @@ class SubscriptionShowSerializer(CustomUserSerializer):
         )
 
 
-class TagSerializer(serializers.ModelSerializer):
+class TagSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Сериализатор тегов.
 
@@ -216,7 +253,12 @@ class TagSerializer(serializers.ModelSerializer):
     Атрибуты:
         - `model` `(Model)`: Модель Tag.
         - `fields` `(tuple)`: Поля, которые должны быть сериализованы.
+
+    Поле `color` отдаётся в формате HEX через свойство `color_hex`
+    модели, хотя в базе цвет хранится 24-битным числом.
     """
+    color = serializers.CharField(source='color_hex', read_only=True)
+
     class Meta:
         model = Tag
         fields = (
@@ -227,7 +269,7 @@ class TagSerializer(serializers.ModelSerializer):
         )
 
 
-class IngredientSerializer(serializers.ModelSerializer):
+class IngredientSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Сериализатор ингредиентов.
 
@@ -246,7 +288,9 @@ class IngredientSerializer(serializers.ModelSerializer):
         )
 
 
-class RecipeIngredientSerializer(serializers.ModelSerializer):
+class RecipeIngredientSerializer(
+    CachedFieldsMixin, serializers.ModelSerializer
+):
     id = serializers.ReadOnlyField(source='ingredient.id')
     name = serializers.ReadOnlyField(source='ingredient.name')
     measurement_unit = serializers.ReadOnlyField(
@@ -263,7 +307,30 @@ class RecipeIngredientSerializer(serializers.ModelSerializer):
         )
 
 
-class RecipeIngredientCreateSerializer(serializers.ModelSerializer):
+class RecipeBriefSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Краткий сериализатор рецептов.
+
+    Сериализатор для компактного отображения рецептов в карточках
+    подписок, где полный состав рецепта не нужен.
+
+    Атрибуты:
+        - `model` `(Model)`: Модель Recipe.
+        - `fields` `(tuple)`: Поля, которые должны быть сериализованы.
+    """
+    class Meta:
+        model = Recipe
+        fields = (
+            'id',
+            'name',
+            'image',
+            'cooking_time'
+        )
+
+
+class RecipeIngredientCreateSerializer(
+    CachedFieldsMixin, serializers.ModelSerializer
+):
     """
     Сериализатор ингредиентов рецепта.
 
@@ -279,7 +346,7 @@ class RecipeIngredientCreateSerializer(serializers.ModelSerializer):
         - `measurement_unit` `(str)`: Единица измерения ингредиента.
         - `amount` `(float)`: Количество ингредиента в рецепте.
     """
-    id = serializers.PrimaryKeyRelatedField(queryset=Ingredient.objects.all())
+    id = serializers.IntegerField()
     amount = serializers.IntegerField(
         required=True,
         write_only=True,
@@ -294,7 +361,7 @@ class RecipeIngredientCreateSerializer(serializers.ModelSerializer):
         )
 
 
-class RecipeSerializer(serializers.ModelSerializer):
+class RecipeSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Сериализатор рецептов.
 
@@ -315,55 +382,27 @@ class RecipeSerializer(serializers.ModelSerializer):
         - `is_favorited` `(bool)`:
             Флаг, указывающий, добавлен ли рецепт в избранное пользователя.
 
-    Методы:
-        - `get_is_in_shopping_cart`:
-            Получить информацию о наличии рецепта в списке пользователя.
-
-        Аргументы:
-            - `object` `(Recipe)`: Объект рецепта.
-
-        Возвращает:
-            - `bool`:
-                True, если рецепт находится
-                в списке пользователя, иначе False.
-
-        - `get_is_favorited`:
-            Получить информацию о наличии рецепта в избранном пользователя.
-
-        Аргументы:
-            - `object` `(Recipe)`: Объект рецепта.
-
-        Возвращает:
-            - `bool`:
-                True, если рецепт находится в
-                избранном пользователя, иначе False.
+    Поля `is_in_shopping_cart` и `is_favorited` читаются из аннотаций
+    `QuerySet` рецептов (см. `RecipeViewSet.get_queryset`); для объектов
+    без аннотаций (анонимные запросы) возвращается False.
     """
     tags = TagSerializer(many=True, read_only=True)
     author = CustomUserSerializer(read_only=True)
     ingredients = RecipeIngredientSerializer(
         many=True,
         read_only=True,
-        source='recipeingredient_set'
+        source='recipe_ingredients'
     )
-    image = serializers.ReadOnlyField(source='image.url')
-    is_in_shopping_cart = serializers.SerializerMethodField(read_only=True)
-    is_favorited = serializers.SerializerMethodField(read_only=True)
-
-    def get_is_in_shopping_cart(self, object):
-        request = self.context.get('request')
-        return (
-            request is not None
-            and not request.user.is_anonymous
-            and request.user.shopping_cart.filter(recipe=object).exists()
-        )
+    image = serializers.SerializerMethodField()
+    is_in_shopping_cart = serializers.BooleanField(
+        read_only=True, default=False
+    )
+    is_favorited = serializers.BooleanField(read_only=True, default=False)
 
-    def get_is_favorited(self, object):
-        request = self.context.get('request')
-        return (
-            request is not None
-            and not request.user.is_anonymous
-            and request.user.favoriting.filter(recipe=object).exists()
-        )
+    def get_image(self, object):
+        if not object.image:
+            return None
+        return recipe_image_url(object.image.name)
 
     class Meta:
         model = Recipe
@@ -382,7 +421,117 @@ class RecipeSerializer(serializers.ModelSerializer):
         )
 
 
-class RecipeCreateSerializer(serializers.ModelSerializer):
+class RecipeListFastSerializer:
+    """
+    Быстрый сериализатор списка рецептов.
+
+    Собирает словари ответа напрямую из `values()`-запросов, минуя
+    создание модельных объектов и полей DRF на горячем пути списка
+    рецептов. Формат ответа совпадает с `RecipeSerializer`.
+
+    Аргументы:
+        - `recipes` `(list)`: Словари рецептов из `values()` с ключами
+            `id`, `name`, `text`, `cooking_time`, `pub_date`, `image`,
+            `author_id` и, для аутентифицированных пользователей,
+            `is_favorited` и `is_in_shopping_cart`.
+        - `request` `(HttpRequest)`: Запрос.
+
+    Атрибуты:
+        - `data` `(list)`: Список словарей рецептов для ответа.
+    """
+
+    _pub_date_field = serializers.DateTimeField()
+
+    def __init__(self, recipes, request=None):
+        self.recipes = list(recipes) if recipes is not None else []
+        self.request = request
+
+    def _get_tags_map(self, recipe_ids):
+        tag_rows = list(
+            Recipe.tags.through.objects.filter(
+                recipe_id__in=recipe_ids
+            ).values_list('recipe_id', 'tag_id')
+        )
+        tags = {}
+        for tag in Tag.objects.filter(
+            id__in={tag_id for _, tag_id in tag_rows}
+        ).values('id', 'name', 'color', 'slug'):
+            tag['color'] = f"#{tag['color']:06X}"
+            tags[tag['id']] = tag
+        tags_map = {}
+        for recipe_id, tag_id in tag_rows:
+            tags_map.setdefault(recipe_id, []).append(tags[tag_id])
+        return tags_map
+
+    def _get_ingredients_map(self, recipe_ids):
+        ingredients_map = {}
+        for row in RecipeIngredient.objects.filter(
+            recipe_id__in=recipe_ids
+        ).values(
+            'recipe_id',
+            'ingredient_id',
+            'ingredient__name',
+            'ingredient__measurement_unit',
+            'amount'
+        ):
+            ingredients_map.setdefault(row['recipe_id'], []).append({
+                'id': row['ingredient_id'],
+                'name': row['ingredient__name'],
+                'measurement_unit': row['ingredient__measurement_unit'],
+                'amount': row['amount']
+            })
+        return ingredients_map
+
+    def _get_authors_map(self):
+        author_ids = {recipe['author_id'] for recipe in self.recipes}
+        subscribed_ids = set()
+        user = getattr(self.request, 'user', None)
+        if user is not None and user.is_authenticated:
+            subscribed_ids = set(
+                AuthorSubscription.objects.filter(
+                    subscriber=user, author_id__in=author_ids
+                ).values_list('author_id', flat=True)
+            )
+        authors_map = {}
+        for author in CustomUser.objects.filter(id__in=author_ids).values(
+            'email', 'id', 'username', 'first_name', 'last_name'
+        ):
+            author['is_subscribed'] = author['id'] in subscribed_ids
+            authors_map[author['id']] = author
+        return authors_map
+
+    @property
+    def data(self):
+        recipe_ids = [recipe['id'] for recipe in self.recipes]
+        tags_map = self._get_tags_map(recipe_ids)
+        ingredients_map = self._get_ingredients_map(recipe_ids)
+        authors_map = self._get_authors_map()
+        return [
+            {
+                'id': recipe['id'],
+                'tags': tags_map.get(recipe['id'], []),
+                'author': authors_map.get(recipe['author_id']),
+                'ingredients': ingredients_map.get(recipe['id'], []),
+                'image': (
+                    recipe_image_url(recipe['image'])
+                    if recipe['image'] else None
+                ),
+                'is_in_shopping_cart': bool(
+                    recipe.get('is_in_shopping_cart', False)
+                ),
+                'is_favorited': bool(recipe.get('is_favorited', False)),
+                'name': recipe['name'],
+                'text': recipe['text'],
+                'cooking_time': recipe['cooking_time'],
+                'pub_date': self._pub_date_field.to_representation(
+                    recipe['pub_date']
+                )
+            }
+            for recipe in self.recipes
+        ]
+
+
+class RecipeCreateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Сериализатор для создания рецептов.
 
@@ -436,17 +585,34 @@ class RecipeCreateSerializer(serializers.ModelSerializer):
     author = CustomUserSerializer(read_only=True)
     image = Base64ImageField(required=False)
 
+    def validate(self, data):
+        ingredients_data = data.get('ingredients')
+        if ingredients_data:
+            ingredient_ids = [
+                ingredient['id'] for ingredient in ingredients_data
+            ]
+            found_ids = Ingredient.objects.in_bulk(ingredient_ids)
+            missing_ids = set(ingredient_ids) - set(found_ids)
+            if missing_ids:
+                raise serializers.ValidationError(
+                    f'Ингредиенты с id {sorted(missing_ids)} не существуют.'
+                )
+        return data
+
     @staticmethod
     def __add_ingredients(ingredients_data, recipe):
 
-        RecipeIngredient.objects.bulk_create([
-            RecipeIngredient(
-                ingredient=ingredient.get('id'),
-                recipe=recipe,
-                amount=ingredient.get('amount')
-            )
-            for ingredient in ingredients_data
-        ])
+        RecipeIngredient.objects.bulk_create(
+            [
+                RecipeIngredient(
+                    ingredient_id=ingredient.get('id'),
+                    recipe=recipe,
+                    amount=ingredient.get('amount')
+                )
+                for ingredient in ingredients_data
+            ],
+            batch_size=INGREDIENT_BATCH_SIZE
+        )
 
     @transaction.atomic
     def create(self, validated_data):
@@ -458,22 +624,40 @@ class RecipeCreateSerializer(serializers.ModelSerializer):
         self.__add_ingredients(ingredients_data, recipe)
         return recipe
 
+    @staticmethod
+    def __update_ingredients(ingredients_data, recipe):
+        desired = {
+            ingredient['id']: ingredient['amount']
+            for ingredient in ingredients_data
+        }
+        RecipeIngredient.objects.filter(recipe=recipe).exclude(
+            ingredient_id__in=desired
+        ).delete()
+        RecipeIngredient.objects.bulk_create(
+            [
+                RecipeIngredient(
+                    recipe=recipe, ingredient_id=ingredient_id, amount=amount
+                )
+                for ingredient_id, amount in desired.items()
+            ],
+            update_conflicts=True,
+            update_fields=['amount'],
+            unique_fields=['recipe', 'ingredient'],
+            batch_size=INGREDIENT_BATCH_SIZE
+        )
+
     @transaction.atomic
     def update(self, instance, validated_data):
-        recipe = instance
         instance.image = validated_data.get('image', instance.image)
         instance.name = validated_data.get('name', instance.name)
-        instance.text = validated_data.get('text', instance.name)
+        instance.text = validated_data.get('text', instance.text)
         instance.cooking_time = validated_data.get(
             'cooking_time', instance.cooking_time
         )
-        instance.tags.clear()
-        instance.ingredients.clear()
         tags_data = validated_data.get('tags')
         instance.tags.set(tags_data)
         ingredients_data = validated_data.get('ingredients')
-        RecipeIngredient.objects.filter(recipe=recipe).delete()
-        self.__add_ingredients(ingredients_data, recipe)
+        self.__update_ingredients(ingredients_data, instance)
         instance.save()
         return instance
 
@@ -1,11 +1,75 @@
 import io
+import os
 
-from django.http import HttpResponse
+from django.conf import settings
+from django.http import FileResponse
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.pdfgen import canvas
 
 
+LEFT_MARGIN = 50
+PAGE_BOTTOM = 50
+FIRST_PAGE_TOP = 750
+NEXT_PAGE_TOP = 800
+LINE_HEIGHT = 20
+TITLE_FONT_SIZE = 18
+LINE_FONT_SIZE = 12
+FONT_PATH = os.path.join(settings.BASE_DIR, 'data', 'arial.ttf')
+
+try:
+    pdfmetrics.getFont('Arial')
+except KeyError:
+    pdfmetrics.registerFont(TTFont('Arial', FONT_PATH, 'UTF-8'))
+
+
+def paginate_lines(lines):
+    """
+    Разбить поток строк на страницы PDF-файла.
+
+    Весь расчёт раскладки (ёмкость первой и последующих страниц,
+    вертикальная координата первой строки) собран здесь, отдельно от
+    рисования: страницы отдаются по мере готовности, не материализуя
+    весь список строк.
+
+    Аргументы:
+        - `lines` `(iterable)`: Строки списка покупок.
+
+    Возвращает:
+        - `generator`: Пары `(start_y, page_lines)` для каждой страницы.
+    """
+    start_y = FIRST_PAGE_TOP
+    page_lines = []
+    for line in lines:
+        page_lines.append(line)
+        if start_y - (len(page_lines) - 1) * LINE_HEIGHT <= PAGE_BOTTOM:
+            yield start_y, page_lines
+            page_lines = []
+            start_y = NEXT_PAGE_TOP
+    if page_lines:
+        yield start_y, page_lines
+
+
+def draw_lines_page(pdf_file, lines, start_y):
+    """
+    Нарисовать страницу строк списка одним текстовым объектом.
+
+    Строки страницы выводятся через `beginText`/`textLines`: раскладка
+    считается пакетно и в PDF попадает один блок `BT…ET` вместо
+    отдельных операторов на каждую строку.
+
+    Аргументы:
+        - `pdf_file` `(Canvas)`: Холст PDF-файла.
+        - `lines` `(list)`: Строки текущей страницы.
+        - `start_y` `(int)`: Вертикальная координата первой строки.
+    """
+    text = pdf_file.beginText(LEFT_MARGIN, start_y)
+    text.setFont('Arial', LINE_FONT_SIZE)
+    text.setLeading(LINE_HEIGHT)
+    text.textLines('\n'.join(lines))
+    pdf_file.drawText(text)
+
+
 def create_shopping_cart(ingredients_cart):
     """
     Создать PDF-файл с списком покупок.
@@ -18,36 +82,34 @@ def create_shopping_cart(ingredients_cart):
         - `ingredients_cart` `(list)`: Список ингредиентов для списка покупок.
 
     Возвращает:
-        - `HttpResponse`: HTTP-ответ с PDF-файлом в виде вложения.
+        - `FileResponse`: HTTP-ответ с PDF-файлом в виде вложения.
+
+    Готовый буфер отдаётся через `FileResponse`: содержимое уходит
+    клиенту кусками через `wsgi.file_wrapper` без промежуточной
+    копии всего файла в теле ответа.
     """
-    response = HttpResponse(content_type='application/pdf')
-    response['Content-Disposition'] = (
-        'attachment; filename="shopping_cart.pdf"'
-    )
-    pdfmetrics.registerFont(TTFont('Arial', 'data/arial.ttf', 'UTF-8'))
     buffer = io.BytesIO()
     pdf_file = canvas.Canvas(buffer)
-    pdf_file.setFont('Arial', 18)
-    pdf_file.drawString(200, 800, 'Список покупок.')
-    pdf_file.setFont('Arial', 12)
-    from_bottom = 750
-    for number, ingredient in enumerate(ingredients_cart, start=1):
-        pdf_file.drawString(50, from_bottom, f"{number}.")
-        pdf_file.drawString(
-            70,
-            from_bottom,
-            f"{ingredient['ingredient__name']}: "
-            f"{ingredient['ingredient_value']} "
-            f"{ingredient['ingredient__measurement_unit']}.",
-        )
-        from_bottom -= 20
-        if from_bottom <= 50:
-            from_bottom = 800
+    pdf_file.setFont('Arial', TITLE_FONT_SIZE)
+    pdf_file.drawString(200, NEXT_PAGE_TOP, 'Список покупок.')
+    lines = (
+        f"{number}. {ingredient['ingredient__name']}: "
+        f"{ingredient['ingredient_value']} "
+        f"{ingredient['ingredient__measurement_unit']}."
+        for number, ingredient in enumerate(ingredients_cart, start=1)
+    )
+    for page_number, (start_y, page_lines) in enumerate(
+        paginate_lines(lines)
+    ):
+        if page_number:
             pdf_file.showPage()
-            pdf_file.setFont('Arial', 14)
+        draw_lines_page(pdf_file, page_lines, start_y)
     pdf_file.showPage()
     pdf_file.save()
-    pdf = buffer.getvalue()
-    buffer.close()
-    response.write(pdf)
-    return response
+    buffer.seek(0)
+    return FileResponse(
+        buffer,
+        as_attachment=True,
+        filename='shopping_cart.pdf',
+        content_type='application/pdf'
+    )
@@ -5,15 +5,22 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework import viewsets, permissions, status
 from django_filters.rest_framework import DjangoFilterBackend
+from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
 from api.serializers import (
     TagSerializer, IngredientSerializer,
-    RecipeSerializer, RecipeCreateSerializer,
-    ShoppingCartSerializer, FavoriteSerializer
+    RecipeSerializer, RecipeCreateSerializer, RecipeListFastSerializer,
+    RecipeBriefSerializer
 )
 from ..filters import RecipeFilter, IngredientSearchFilter
+from ..pagination import LimitPageNumberPagination
 from ..utils import create_shopping_cart
-from django.db.models import Sum
+from django.db.models import BooleanField, Exists, OuterRef, Sum, Value
+
+
+TAG_CACHE_TIMEOUT = 60 * 5
 
 
 class TagViewSet(viewsets.ReadOnlyModelViewSet):
@@ -31,6 +38,16 @@ class TagViewSet(viewsets.ReadOnlyModelViewSet):
     pagination_class = None
     permission_classes = (permissions.AllowAny,)
 
+    @method_decorator(cache_page(TAG_CACHE_TIMEOUT))
+    def list(self, request, *args, **kwargs):
+        """Возвращает кэшированный список тегов."""
+        return super().list(request, *args, **kwargs)
+
+    @method_decorator(cache_page(TAG_CACHE_TIMEOUT))
+    def retrieve(self, request, *args, **kwargs):
+        """Возвращает кэшированный тег."""
+        return super().retrieve(request, *args, **kwargs)
+
 
 class IngredientViewSet(viewsets.ReadOnlyModelViewSet):
     """
@@ -46,7 +63,7 @@ class IngredientViewSet(viewsets.ReadOnlyModelViewSet):
             Кортеж фильтров для применения к запросу.
         - `filterset_class` `(class)`: Класс фильтра для поиска ингредиентов.
     """
-    queryset = Ingredient.objects.all()
+    queryset = Ingredient.objects.only('id', 'name', 'measurement_unit')
     serializer_class = IngredientSerializer
     pagination_class = None
     filter_backends = (DjangoFilterBackend,)
@@ -80,6 +97,63 @@ class RecipeViewSet(viewsets.ModelViewSet):
     queryset = Recipe.objects.all()
     filter_backends = (DjangoFilterBackend,)
     filterset_class = RecipeFilter
+    pagination_class = LimitPageNumberPagination
+
+    def get_queryset(self):
+        """
+        Возвращает `QuerySet` рецептов с аннотациями
+            `is_favorited` и `is_in_shopping_cart`.
+
+        Автор, теги и ингредиенты загружаются заранее через
+        `select_related`/`prefetch_related`, чтобы вложенные сериализаторы
+        не выполняли отдельные запросы для каждого рецепта.
+
+        Для аутентифицированного пользователя оба флага вычисляются
+        подзапросами `EXISTS` в том же SQL-запросе, что и сами рецепты,
+        вместо отдельных запросов на каждый рецепт.
+
+        Возвращает:
+            - `QuerySet`: Запрос для выбора рецептов.
+        """
+        queryset = Recipe.with_full()
+        user = self.request.user
+        if user.is_authenticated:
+            queryset = queryset.annotate(
+                is_favorited=Exists(
+                    Favorite.objects.filter(user=user, recipe=OuterRef('pk'))
+                ),
+                is_in_shopping_cart=Exists(
+                    ShoppingCart.objects.filter(
+                        user=user, recipe=OuterRef('pk')
+                    )
+                )
+            )
+        else:
+            queryset = queryset.annotate(
+                is_favorited=Value(False, output_field=BooleanField()),
+                is_in_shopping_cart=Value(False, output_field=BooleanField())
+            )
+        return queryset
+
+    def filter_queryset(self, queryset):
+        """
+        Применяет фильтры только при наличии параметров фильтрации.
+
+        Без параметров `django-filter` всё равно строит форму фильтра
+        на каждый запрос; для обычного списка рецептов этот шаг
+        пропускается полностью.
+
+        Аргументы:
+            - `queryset` `(QuerySet)`: Исходный QuerySet рецептов.
+
+        Возвращает:
+            - `QuerySet`: Фильтрованный QuerySet рецептов.
+        """
+        if not set(self.request.query_params) & set(
+            self.filterset_class.base_filters
+        ):
+            return queryset
+        return super().filter_queryset(queryset)
 
     def get_serializer_class(self):
         """
@@ -92,6 +166,32 @@ class RecipeViewSet(viewsets.ModelViewSet):
             return RecipeSerializer
         return RecipeCreateSerializer
 
+    def list(self, request, *args, **kwargs):
+        """
+        Возвращает список рецептов через `RecipeListFastSerializer`.
+
+        Рецепты выбираются как словари через `values()` и сшиваются
+        несколькими пакетными запросами, минуя модельные объекты и
+        поля DRF на самом нагруженном эндпоинте.
+
+        Аргументы:
+            - `request` `(HttpRequest)`: Запрос.
+
+        Возвращает:
+            - `Response`: Ответ со списком рецептов.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        recipes = queryset.values(
+            'id', 'name', 'text', 'cooking_time', 'pub_date',
+            'image', 'author_id', 'is_favorited', 'is_in_shopping_cart'
+        )
+        page = self.paginate_queryset(recipes)
+        if page is not None:
+            serializer = RecipeListFastSerializer(page, request)
+            return self.get_paginated_response(serializer.data)
+        serializer = RecipeListFastSerializer(recipes, request)
+        return Response(serializer.data)
+
     @action(
         detail=True,
         methods=['post', 'delete'],
@@ -111,21 +211,30 @@ class RecipeViewSet(viewsets.ModelViewSet):
         Возвращает:
             - `Response`: Ответ на запрос.
         """
-        recipe = get_object_or_404(Recipe, pk=pk)
         if request.method == 'POST':
-            serializer = ShoppingCartSerializer(
-                data={'user': request.user.id, 'recipe': recipe.id}
+            recipe = get_object_or_404(
+                Recipe.objects.only('id', 'name', 'image', 'cooking_time'),
+                pk=pk
+            )
+            _, created = ShoppingCart.objects.get_or_create(
+                user=request.user, recipe=recipe
+            )
+            if not created:
+                return Response(
+                    {'errors': 'Рецепт уже в списке покупок.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            shopping_cart_serializer = RecipeBriefSerializer(
+                recipe, context={'request': request}
             )
-            serializer.is_valid(raise_exception=True)
-            serializer.save()
-            shopping_cart_serializer = RecipeSerializer(recipe)
             return Response(
                 shopping_cart_serializer.data, status=status.HTTP_201_CREATED
             )
-        shopping_cart_recipe = get_object_or_404(
-            ShoppingCart, user=request.user, recipe=recipe
-        )
-        shopping_cart_recipe.delete()
+        deleted, _ = ShoppingCart.objects.filter(
+            user=request.user, recipe_id=pk
+        ).delete()
+        if not deleted:
+            raise Http404
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @action(
@@ -156,7 +265,9 @@ class RecipeViewSet(viewsets.ModelViewSet):
                 'ingredient__name'
             ).annotate(ingredient_value=Sum('amount'))
         )
-        return create_shopping_cart(ingredients_cart)
+        return create_shopping_cart(
+            ingredients_cart.iterator(chunk_size=2000)
+        )
 
     @action(
         detail=True,
@@ -176,19 +287,28 @@ class RecipeViewSet(viewsets.ModelViewSet):
         Возвращает:
             - `Response`: Ответ на запрос.
         """
-        recipe = get_object_or_404(Recipe, pk=pk)
         if request.method == 'POST':
-            serializer = FavoriteSerializer(
-                data={'user': request.user.id, 'recipe': recipe.id}
+            recipe = get_object_or_404(
+                Recipe.objects.only('id', 'name', 'image', 'cooking_time'),
+                pk=pk
+            )
+            _, created = Favorite.objects.get_or_create(
+                user=request.user, recipe=recipe
+            )
+            if not created:
+                return Response(
+                    {'errors': 'Рецепт уже в избранном.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            favorite_serializer = RecipeBriefSerializer(
+                recipe, context={'request': request}
             )
-            serializer.is_valid(raise_exception=True)
-            serializer.save()
-            favorite_serializer = RecipeSerializer(recipe)
             return Response(
                 favorite_serializer.data, status=status.HTTP_201_CREATED
             )
-        favorite_recipe = get_object_or_404(
-            Favorite, user=request.user, recipe=recipe
-        )
-        favorite_recipe.delete()
+        deleted, _ = Favorite.objects.filter(
+            user=request.user, recipe_id=pk
+        ).delete()
+        if not deleted:
+            raise Http404
         return Response(status=status.HTTP_204_NO_CONTENT)
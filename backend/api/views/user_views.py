@@ -1,5 +1,7 @@
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef
 from django.shortcuts import get_object_or_404
 from users.models import CustomUser, AuthorSubscription
 from api.serializers import (
@@ -11,6 +13,9 @@ from rest_framework.pagination import PageNumberPagination
 from djoser.views import UserViewSet
 
 
+SUBSCRIPTION_CARD_TIMEOUT = 60
+
+
 class CustomUserViewSet(UserViewSet):
     """
     Класс представления для пользователей с дополнительными действиями.
@@ -30,6 +35,34 @@ class CustomUserViewSet(UserViewSet):
     serializer_class = CustomUserSerializer
     permission_classes = (AnonimOrAuthenticatedReadOnly,)
 
+    def get_queryset(self):
+        """
+        Возвращает `QuerySet` пользователей с аннотацией `is_subscribed`.
+
+        Для аутентифицированного пользователя флаг подписки вычисляется
+        подзапросом `EXISTS` в том же SQL-запросе, что и сами пользователи,
+        вместо отдельного запроса на каждого пользователя.
+
+        Запрос сужен до сериализуемых колонок: хэш пароля и служебные
+        поля не читаются из базы на каждый список пользователей.
+
+        Возвращает:
+            - `QuerySet`: Запрос для выбора пользователей.
+        """
+        queryset = CustomUser.objects.only(
+            'id', 'email', 'username', 'first_name', 'last_name'
+        )
+        user = self.request.user
+        if user.is_authenticated:
+            queryset = queryset.annotate(
+                is_subscribed=Exists(
+                    AuthorSubscription.objects.filter(
+                        author=OuterRef('pk'), subscriber=user
+                    )
+                )
+            )
+        return queryset
+
     @action(
         detail=False,
         methods=['get', 'patch'],
@@ -108,13 +141,33 @@ class CustomUserViewSet(UserViewSet):
         Получить список подписок пользователя.
 
         Возвращает список авторов, на которых подписан текущий пользователь.
+
+        Карточки авторов кэшируются на пару (автор, пользователь) с
+        коротким TTL: при кэше по умолчанию (локальная память процесса)
+        изменения видны всем воркерам не позднее чем через
+        `SUBSCRIPTION_CARD_TIMEOUT` секунд.
         """
-        authors = CustomUser.objects.filter(author__subscriber=request.user)
+        authors = CustomUser.objects.filter(
+            author__subscriber=request.user
+        ).annotate(
+            is_subscribed=Exists(
+                AuthorSubscription.objects.filter(
+                    author=OuterRef('pk'), subscriber=request.user
+                )
+            )
+        )
         paginator = PageNumberPagination()
         result_pages = paginator.paginate_queryset(
             queryset=authors, request=request
         )
-        serializer = SubscriptionShowSerializer(
-            result_pages, context={'request': request}, many=True
-        )
-        return paginator.get_paginated_response(serializer.data)
+        data = [
+            cache.get_or_set(
+                f'subscription_card:{author.id}:{request.user.id}',
+                lambda author=author: SubscriptionShowSerializer(
+                    author, context={'request': request}
+                ).data,
+                SUBSCRIPTION_CARD_TIMEOUT
+            )
+            for author in result_pages
+        ]
+        return paginator.get_paginated_response(data)
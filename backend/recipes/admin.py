@@ -6,7 +6,7 @@ from django.utils.safestring import mark_safe
 
 @admin.register(Tag)
 class TagAdmin(admin.ModelAdmin):
-    list_display = ('name', 'color', 'slug')
+    list_display = ('name', 'color_hex', 'slug')
     search_fields = ('name',)
 
 
@@ -24,10 +24,17 @@ class RecipeAdmin(admin.ModelAdmin):
     list_filter = ('author', 'name', 'tags')
     filter_horizontal = ('ingredients', 'tags')
 
+    def get_queryset(self, request):
+        """Загружает автора и ингредиенты вместе со списком рецептов."""
+        return super().get_queryset(request).select_related(
+            'author'
+        ).prefetch_related('ingredients')
+
     def get_total_favorite_count(self, obj):
-        return obj.favoriting.count()
+        return obj.favorites_count
 
     get_total_favorite_count.short_description = 'Избранное'
+    get_total_favorite_count.admin_order_field = 'favorites_count'
 
     def get_ingredients(self, object):
         """Получает ингредиент или список ингредиентов рецепта."""
@@ -43,6 +50,12 @@ class RecipeAdmin(admin.ModelAdmin):
 class RecipeIngredientAdmin(admin.ModelAdmin):
     list_display = ('recipe', 'ingredient', 'amount', 'get_unit')
 
+    def get_queryset(self, request):
+        """Загружает рецепт и ингредиент вместе со строками списка."""
+        return super().get_queryset(request).select_related(
+            'recipe', 'ingredient'
+        )
+
     def get_unit(self, obj):
         return obj.ingredient.measurement_unit if obj.ingredient else ''
 
@@ -53,7 +66,19 @@ class RecipeIngredientAdmin(admin.ModelAdmin):
 class ShoppingListItemAdmin(admin.ModelAdmin):
     list_display = ('user', 'recipe')
 
+    def get_queryset(self, request):
+        """Загружает пользователя и рецепт вместе со строками списка."""
+        return super().get_queryset(request).select_related(
+            'user', 'recipe'
+        )
+
 
 @admin.register(Favorite)
 class FavoriteRecipeAdmin(admin.ModelAdmin):
     list_display = ('user', 'recipe', 'added_at')
+
+    def get_queryset(self, request):
+        """Загружает пользователя и рецепт вместе со строками списка."""
+        return super().get_queryset(request).select_related(
+            'user', 'recipe'
+        )
@@ -2,26 +2,39 @@ import csv
 
 from foodgram.settings import CSV_FILES_DIR
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from recipes.models import Ingredient
 
 
+INGREDIENT_BATCH_SIZE = 1000
+CSV_READ_BUFFER_SIZE = 1 << 20
+
+
 class Command(BaseCommand):
     help = 'Импорт ингредиентов из CSV-файла'
 
     def handle(self, *args, **options):
         file_path = f'{CSV_FILES_DIR}/ingredients.csv'
 
-        with open(file_path, 'r', encoding='utf-8') as csv_file:
-            csv_reader = csv.reader(csv_file)
-            for row in csv_reader:
-                ingredient_name = row[0].strip()
-                ingredient_unit = row[1].strip()
-
-                ingredient, created = Ingredient.objects.get_or_create(
-                    name=ingredient_name,
-                    measurement_unit=ingredient_unit
-                )
+        with open(
+            file_path, 'r', encoding='utf-8', buffering=CSV_READ_BUFFER_SIZE
+        ) as csv_file:
+            rows = {
+                (row[0].strip(), row[1].strip())
+                for row in csv.reader(csv_file)
+                if row
+            }
+        ingredients = [
+            Ingredient(name=name, measurement_unit=unit)
+            for name, unit in rows
+        ]
+        with transaction.atomic():
+            Ingredient.objects.bulk_create(
+                ingredients,
+                batch_size=INGREDIENT_BATCH_SIZE,
+                ignore_conflicts=True
+            )
 
-                self.stdout.write(self.style.SUCCESS(
-                    f'Успешно создан ингредиент: {ingredient_name}'
-                ))
+        self.stdout.write(self.style.SUCCESS(
+            f'Импорт завершён, уникальных строк в файле: {len(ingredients)}'
+        ))
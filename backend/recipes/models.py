@@ -1,21 +1,38 @@
+import io
+import os
+
+from PIL import Image
+from django.contrib.postgres.indexes import OpClass
+from django.core.files.base import ContentFile
+from django.core.validators import MaxValueValidator
 from django.db import models
-from django.db.models import UniqueConstraint
+from django.db.models import CheckConstraint, Q, UniqueConstraint
+from django.db.models.functions import Lower
+from django.utils.functional import cached_property
 from users.models import CustomUser
 from .validators import (
-    validate_hex_color,
     validate_slug,
     validate_positive_integer,
     validate_name,
 )
 
 
+MAX_COLOR_VALUE = 0xFFFFFF
+
+
+RECIPE_IMAGE_MAX_SIZE = (800, 600)
+RECIPE_IMAGE_WEBP_QUALITY = 80
+RECIPE_IMAGE_WEBP_METHOD = 4
+
+
 class Tag(models.Model):
     """
     Модель для хранения тегов, которые могут быть присвоены рецептам.
 
     Поля:
     - `name`: Название тега.
-    - `color`: Цвет тега (в формате HEX).
+    - `color`: Цвет тега (24-битное число, HEX-представление
+        доступно через свойство `color_hex`).
     - `slug`: Уникальный идентификатор тега.
 
     """
@@ -27,12 +44,11 @@ class Tag(models.Model):
         verbose_name='Название',
         validators=[validate_name]
     )
-    color = models.CharField(
-        max_length=7,
+    color = models.PositiveIntegerField(
         blank=False,
         null=False,
         verbose_name='Цвет',
-        validators=[validate_hex_color]
+        validators=[MaxValueValidator(MAX_COLOR_VALUE)]
     )
     slug = models.SlugField(
         max_length=200,
@@ -47,10 +63,25 @@ class Tag(models.Model):
         verbose_name = 'Тег'
         verbose_name_plural = 'Теги'
         ordering = ('name',)
+        constraints = [
+            CheckConstraint(
+                check=Q(color__lte=MAX_COLOR_VALUE),
+                name='tag_color_24bit'
+            )
+        ]
 
     def __str__(self):
         return self.slug
 
+    @property
+    def color_hex(self):
+        """Возвращает цвет тега в формате HEX (`#RRGGBB`)."""
+        return f'#{self.color:06X}'
+
+    @color_hex.setter
+    def color_hex(self, value):
+        self.color = int(value.lstrip('#'), 16)
+
 
 class Ingredient(models.Model):
     """
@@ -79,6 +110,18 @@ class Ingredient(models.Model):
         verbose_name = 'Ингредиент'
         verbose_name_plural = 'Ингредиенты'
         ordering = ('name',)
+        constraints = [
+            UniqueConstraint(
+                fields=['name', 'measurement_unit'],
+                name='unique_ingredient_name_unit'
+            )
+        ]
+        indexes = [
+            models.Index(
+                OpClass(Lower('name'), name='text_pattern_ops'),
+                name='ingredient_name_lower_idx'
+            )
+        ]
 
     def __str__(self):
         return self.name
@@ -98,6 +141,9 @@ class Recipe(models.Model):
     - `tags`: Связь многие-ко-многим с моделью Tag.
     - `cooking_time`: Время приготовления (в минутах).
     - `pub_date`: Дата публикации рецепта.
+    - `favorites_count`: Денормализованное количество добавлений
+        рецепта в избранное (поддерживается сигналами,
+        см. `recipes.signals`).
 
     """
     author = models.ForeignKey(
@@ -148,15 +194,89 @@ class Recipe(models.Model):
         editable=False,
         verbose_name='Дата публикации'
     )
+    favorites_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество добавлений в избранное'
+    )
 
     class Meta:
         verbose_name = 'Рецепт'
         verbose_name_plural = 'Рецепты'
         ordering = ('-pub_date',)
+        indexes = [
+            models.Index(
+                fields=['-pub_date'],
+                name='recipe_pub_date_desc_idx'
+            )
+        ]
+        constraints = [
+            CheckConstraint(
+                check=Q(cooking_time__gte=1),
+                name='recipe_cooking_time_gte_1'
+            )
+        ]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        """
+        Сохранить рецепт, перекодировав новую картинку в WebP.
+
+        Загруженное изображение ужимается до `RECIPE_IMAGE_MAX_SIZE` и
+        сохраняется в WebP: страницы списка отдают заметно меньше байт,
+        чем с исходными JPEG/PNG. Уже перекодированные картинки
+        повторно не обрабатываются.
+        """
+        if self.image and not self.image.name.lower().endswith('.webp'):
+            image = Image.open(self.image)
+            if image.mode not in ('RGB', 'RGBA'):
+                image = image.convert('RGBA')
+            image.thumbnail(RECIPE_IMAGE_MAX_SIZE, Image.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(
+                buffer,
+                'WEBP',
+                quality=RECIPE_IMAGE_WEBP_QUALITY,
+                method=RECIPE_IMAGE_WEBP_METHOD
+            )
+            name = os.path.splitext(os.path.basename(self.image.name))[0]
+            self.image.save(
+                f'{name}.webp', ContentFile(buffer.getvalue()), save=False
+            )
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def with_full(cls):
+        """
+        Вернуть `QuerySet` рецептов со всеми связями для сериализации.
+
+        Автор выбирается через `select_related`, теги и ингредиенты —
+        через `prefetch_related` с проекцией до сериализуемых колонок,
+        чтобы показ рецепта не порождал дополнительных запросов
+        на каждую связь.
+
+        Возвращает:
+            - `QuerySet`: Запрос для выбора рецептов со связями.
+        """
+        return cls.objects.select_related('author').only(
+            'id', 'name', 'image', 'text', 'cooking_time', 'pub_date',
+            'author__id', 'author__email', 'author__username',
+            'author__first_name', 'author__last_name'
+        ).prefetch_related(
+            'tags',
+            models.Prefetch(
+                'recipe_ingredients',
+                queryset=RecipeIngredient.objects.select_related(
+                    'ingredient'
+                ).only(
+                    'id', 'recipe', 'amount', 'ingredient__id',
+                    'ingredient__name', 'ingredient__measurement_unit'
+                )
+            )
+        )
+
 
 class RecipeIngredient(models.Model):
     """
@@ -171,6 +291,7 @@ class RecipeIngredient(models.Model):
     recipe = models.ForeignKey(
         Recipe,
         on_delete=models.CASCADE,
+        related_name='recipe_ingredients',
         verbose_name='Рецепт'
     )
     ingredient = models.ForeignKey(
@@ -188,11 +309,25 @@ class RecipeIngredient(models.Model):
             UniqueConstraint(
                 fields=['recipe', 'ingredient'],
                 name='unique_recipe_ingredient'
+            ),
+            CheckConstraint(
+                check=Q(amount__gte=1),
+                name='recipe_ingredient_amount_gte_1'
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=['recipe', 'ingredient'],
+                include=['amount'],
+                name='recipe_ingredient_cover_idx'
+            ),
+            models.Index(
+                fields=['ingredient'],
+                name='recipe_ingredient_ing_idx'
             )
         ]
         verbose_name = 'Ингредиент для рецепта'
         verbose_name_plural = 'Ингредиенты для рецепта'
-        ordering = ('recipe',)
 
     def __str__(self):
         return (
@@ -235,12 +370,20 @@ class Favorite(models.Model):
                 name='unique_user_recipe'
             )
         ]
+        indexes = [
+            models.Index(fields=['recipe'], name='favorite_recipe_idx')
+        ]
         verbose_name = 'Избранный рецепт'
         verbose_name_plural = 'Избранные рецепты'
 
-    def __str__(self):
+    @cached_property
+    def display_name(self):
+        """Отображаемое имя записи, собирается один раз на объект."""
         return f'{self.user.username} - {self.recipe.name}'
 
+    def __str__(self):
+        return self.display_name
+
 
 class ShoppingCart(models.Model):
     """
@@ -271,9 +414,16 @@ class ShoppingCart(models.Model):
                 name='unique_user_recipe_in_cart'
             )
         ]
+        indexes = [
+            models.Index(fields=['recipe'], name='shopping_cart_recipe_idx')
+        ]
         verbose_name = 'Рецепт для списка покупок'
         verbose_name_plural = 'Рецепты для списка покупок'
-        ordering = ('user',)
+
+    @cached_property
+    def display_name(self):
+        """Отображаемое имя записи, собирается один раз на объект."""
+        return f'{self.recipe} в списке покупок у {self.user}'
 
     def __str__(self):
-        return (f'{self.recipe} в списке покупок у {self.user}')
+        return self.display_name
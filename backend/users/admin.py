@@ -31,3 +31,9 @@ class CustomUserAdmin(BaseUserAdmin):
 @admin.register(AuthorSubscription)
 class AuthorSubscriptionAdmin(admin.ModelAdmin):
     list_display = ('subscriber', 'author')
+
+    def get_queryset(self, request):
+        """Загружает подписчика и автора вместе со строками списка."""
+        return super().get_queryset(request).select_related(
+            'subscriber', 'author'
+        )
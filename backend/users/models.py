@@ -15,6 +15,8 @@ custom_username_validator = UnicodeUsernameValidator(
             'цифры и символы: @/./+/-/_'
 )
 
+email_validator = EmailValidator(WARNING_MSG_EMAIL)
+
 
 class CustomUser(AbstractUser):
     """
@@ -28,6 +30,12 @@ class CustomUser(AbstractUser):
         (обязательное поле, уникальное, подчиняется кастомному валидатору).
     - `first_name`: Имя пользователя.
     - `last_name`: Фамилия пользователя.
+    - `recipes_count`: Денормализованное количество рецептов пользователя.
+    - `followers_count`: Денормализованное количество подписчиков.
+
+    Счётчики поддерживаются сигналами (см. `recipes.signals` и
+    `users.signals`) и читаются за O(1) вместо `COUNT(*)` на каждого
+    пользователя в списках.
 
     Атрибуты:
     - `USERNAME_FIELD`:
@@ -37,8 +45,7 @@ class CustomUser(AbstractUser):
     """
     email = models.EmailField(
         max_length=254,
-        validators=[EmailValidator(
-            WARNING_MSG_EMAIL)],
+        validators=[email_validator],
         verbose_name='Адрес электронной почты',
         unique=True,
         error_messages={
@@ -69,6 +76,16 @@ class CustomUser(AbstractUser):
         null=False,
         verbose_name='Фамилия'
     )
+    recipes_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество рецептов'
+    )
+    followers_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество подписчиков'
+    )
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = (
@@ -121,7 +138,14 @@ class AuthorSubscription(models.Model):
         constraints = [
             UniqueConstraint(
                 fields=['author', 'subscriber'],
-                name='unique_author_subscription'
+                name='unique_author_subscription',
+                include=['id']
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=['subscriber'],
+                name='subscription_subscriber_idx'
             )
         ]
         verbose_name = 'Подписка на автора'
@@ -0,0 +1,22 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import AuthorSubscription, CustomUser
+
+
+@receiver(post_save, sender=AuthorSubscription)
+def subscription_saved(sender, instance, created, **kwargs):
+    """Увеличивает счётчик подписчиков автора при подписке."""
+    if created:
+        CustomUser.objects.filter(pk=instance.author_id).update(
+            followers_count=F('followers_count') + 1
+        )
+
+
+@receiver(post_delete, sender=AuthorSubscription)
+def subscription_deleted(sender, instance, **kwargs):
+    """Уменьшает счётчик подписчиков автора при отписке."""
+    CustomUser.objects.filter(pk=instance.author_id).update(
+        followers_count=F('followers_count') - 1
+    )